@@ -1,12 +1,14 @@
 import importlib.util
+import os
 import re
 import time
-from collections.abc import Callable, Collection, Iterable
+from collections.abc import Callable, Collection, Iterable, Sequence
 from concurrent.futures import Future
 from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum, auto
 from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypeVar
 
@@ -18,6 +20,8 @@ from typer import Typer, get_app_dir
 
 APP_DIR = Path(get_app_dir("odoo-toolkit"))
 EMPTY_LIST: list[Any] = []
+MODULE_GROUPS = {"all", "community", "enterprise", "community-l10n", "enterprise-l10n"}
+GLOB_PATTERN_RE = re.compile(r"[*?[]")
 T = TypeVar("T")
 
 
@@ -226,41 +230,103 @@ def get_valid_modules_to_path_mapping(
         defaults to always `True`.
     :return: A mapping from all valid modules to their directories.
     """
-    base_module_path = com_path.expanduser().resolve() / "odoo" / "addons"
-    com_modules_path = com_path.expanduser().resolve() / "addons"
+    com_root = com_path.expanduser().resolve()
+    base_module_path = com_root / "odoo" / "addons"
+    com_modules_path = com_root / "addons"
     ent_modules_path = ent_path.expanduser().resolve()
     extra_modules_paths = [p.expanduser().resolve() for p in extra_addons_paths]
 
-    com_modules = {f.parent.name: com_modules_path / f.parent.name for f in com_modules_path.glob("*/__manifest__.py")}
-    ent_modules = {f.parent.name: ent_modules_path / f.parent.name for f in ent_modules_path.glob("*/__manifest__.py")}
-    extra_modules = {f.parent.name: p / f.parent.name for p in extra_modules_paths for f in p.glob("*/__manifest__.py")}
+    if not MODULE_GROUPS.intersection(modules) and not any(GLOB_PATTERN_RE.search(m) for m in modules):
+        # Only explicit module names were requested, so we don't need to scan all addons directories.
+        return _get_explicit_modules_to_path_mapping(
+            modules=modules,
+            base_module_path=base_module_path,
+            addons_paths=[com_modules_path, ent_modules_path, *extra_modules_paths],
+            include_path=include_path,
+        )
+
+    com_modules = find_modules(com_modules_path)
+    ent_modules = find_modules(ent_modules_path)
+    extra_modules = {m: mp for p in extra_modules_paths for m, mp in find_modules(p).items()}
 
     all_modules = {"base": base_module_path / "base"} | com_modules | ent_modules | extra_modules
 
-    # Determine all modules to consider.
+    # Determine all modules to consider in a single pass, where later selections take precedence.
+    select_all = "all" in modules
+    select_com = "community" in modules
+    select_ent = "enterprise" in modules
+    select_com_l10n = "community-l10n" in modules
+    select_ent_l10n = "enterprise-l10n" in modules
+    patterns = [m for m in modules if m not in MODULE_GROUPS]
+
     modules_to_consider: dict[str, Path] = {}
-    if "all" in modules:
-        modules_to_consider.update((m, p) for m, p in all_modules.items() if include_path(p))
-    if "community" in modules:
-        modules_to_consider.update((m, p) for m, p in com_modules.items() if include_path(p))
-    if "enterprise" in modules:
-        modules_to_consider.update((m, p) for m, p in ent_modules.items() if include_path(p))
-    if "community-l10n" in modules:
-        modules_to_consider.update(
-            (m, p) for m, p in com_modules.items() if is_l10n_module(m) and include_path(p)
+    for m, path in all_modules.items():
+        is_l10n = is_l10n_module(m)
+        candidates = (
+            path if select_all else None,
+            com_modules.get(m) if select_com or (select_com_l10n and is_l10n) else None,
+            ent_modules.get(m) if select_ent or (select_ent_l10n and is_l10n) else None,
+            path if any(fnmatch(m, mp) for mp in patterns) else None,
         )
-    if "enterprise-l10n" in modules:
-        modules_to_consider.update(
-            (m, p) for m, p in ent_modules.items() if is_l10n_module(m) and include_path(p)
-        )
-    modules_to_consider.update(
-        (m, p) for m, p in all_modules.items()
-        if any(fnmatch(m, mp) for mp in modules) and include_path(p)
-    )
+        selected = next((p for p in reversed(candidates) if p and include_path(p)), None)
+        if selected:
+            modules_to_consider[m] = selected
 
     return modules_to_consider
 
 
+def _get_explicit_modules_to_path_mapping(
+    *,
+    modules: Iterable[str],
+    base_module_path: Path,
+    addons_paths: Sequence[Path],
+    include_path: Callable[[Path], bool],
+) -> dict[str, Path]:
+    """Determine the directories of the given module names by only checking for their manifests.
+
+    :param modules: The requested module names.
+    :param base_module_path: The directory containing the `base` module.
+    :param addons_paths: The addons directories, in increasing order of precedence.
+    :param include_path: A function to include modules.
+    :return: A mapping from all valid modules to their directories.
+    """
+    module_to_path: dict[str, Path] = {}
+    for module in filter(None, modules):
+        module_path = base_module_path / module if module == "base" else None
+        for addons_path in addons_paths:
+            if (addons_path / module / "__manifest__.py").is_file():
+                module_path = addons_path / module
+        if module_path and include_path(module_path):
+            module_to_path[module] = module_path
+    return module_to_path
+
+
+def find_modules(addons_path: Path) -> dict[str, Path]:
+    """Find all Odoo modules directly inside the given addons directory.
+
+    The directory is only scanned again if its contents changed, since commands look for modules in several steps.
+
+    :param addons_path: The directory containing the modules.
+    :return: A mapping from the module names to their directories.
+    """
+    try:
+        mtime_ns = addons_path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return dict(_find_modules(addons_path, mtime_ns))
+
+
+@lru_cache(maxsize=16)
+def _find_modules(addons_path: Path, _mtime_ns: int) -> dict[str, Path]:
+    modules: dict[str, Path] = {}
+    with suppress(OSError), os.scandir(addons_path) as entries:
+        for entry in entries:
+            # The directory entry's cached type info avoids an extra `stat()` call for most entries.
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__manifest__.py")):  # noqa: PTH113, PTH118
+                modules[entry.name] = addons_path / entry.name
+    return modules
+
+
 def update_remote_progress(
     progress: Progress,
     progress_updates: dict[Any, ProgressUpdate],
@@ -333,7 +399,7 @@ def get_odoo_version(odoo_repo: Path) -> float | None:
 
 def normalize_list_option(option_list: Collection[str]) -> list[str]:
     """Normalize input by splitting comma-separated strings into a list."""
-    if len(option_list) > 0 and any("," in options for options in option_list):
+    if any("," in options for options in option_list):
         return [option.strip() for options in option_list for option in options.split(",")]
     return list(option_list)
 
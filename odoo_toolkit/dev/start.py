@@ -24,6 +24,9 @@ from odoo_toolkit.common import (
 from .common import DOCKER
 from .stop import stop_containers
 
+# Matches the build step progress (like `[3/12]`) in the Docker build logs.
+BUILD_STEP_RE = re.compile(rb"(\d+)/(\d+)\]")
+
 app = Typer()
 
 
@@ -159,7 +162,7 @@ def _ensure_docker_image(odoo_version: str, build: bool, build_no_cache: bool, p
         for stream_type, stream_content in output_generator:
             if stream_type != "stdout":
                 continue
-            match = re.search(r"(\d+)/(\d+)\]", stream_content.decode())
+            match = BUILD_STEP_RE.search(stream_content)
             if match:
                 completed, total = (int(g) for g in match.groups())
                 progress.update(
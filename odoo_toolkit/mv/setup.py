@@ -1,16 +1,22 @@
+import contextlib
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
+from collections.abc import Callable, Iterable
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cache
 from itertools import chain
 from multiprocessing import Manager
 from pathlib import Path
+from stat import S_ISDIR
 from subprocess import CalledProcessError
+from threading import Lock
 from typing import Annotated, TypeAlias, cast
 
-from git import BadName, BadObject, GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, RemoteProgress, Repo
 from typer import Exit, Option, Typer
 
 from odoo_toolkit.common import (
@@ -37,14 +43,30 @@ DEFAULT_REPOS = [
     OdooRepo.UPGRADE,
     OdooRepo.UPGRADE_UTIL,
 ]
+# The maximum number of simultaneous clones, to avoid getting throttled by GitHub.
+MAX_CLONE_WORKERS = 4
+VERSION_NUMBER_RE = re.compile(r"\d+\.\d")
 JS_TOOLING_MIN_VERSION = 14.5
 JS_TOOLING_NEW_VERSION = 16.1
+JS_TOOLING_FILES = (
+    ".eslintignore",
+    ".eslintrc.json",
+    "jsconfig.json",
+    "package.json",
+    "package-lock.json",
+    # Support old versions
+    ".prettierignore",
+    ".prettierrc.json",
+)
+JS_TOOLING_SOURCE_FILES = ("_eslintignore", "_eslintrc.json", "_jsconfig.json", "_package.json")
+# Stored in node_modules, which is ignored by Git and removed when disabling the tooling.
+JS_TOOLING_HASH_FILE = ".multiverse-tooling-hash"
 MULTIVERSE_CONFIG_DIR = Path(__file__).parent.parent / "multiverse_config"
 JSONValue: TypeAlias = dict[str, "JSONValue"] | list["JSONValue"] | str | int | float | bool | None
 
 
 @app.command()
-def setup(
+def setup(  # noqa: PLR0917
     branches: Annotated[
         list[str],
         Option(
@@ -81,6 +103,18 @@ def setup(
         bool,
         Option("--vscode", help="Copy settings and debug configurations for Visual Studio Code."),
     ] = False,
+    partial: Annotated[
+        bool,
+        Option(
+            "--partial/--no-partial",
+            help="Clone the multi-branch repositories without file contents and only fetch them when they are needed "
+            "for a worktree.",
+        ),
+    ] = True,
+    depth: Annotated[
+        int | None,
+        Option("--depth", help="Only clone this many commits of history for the single-branch repositories."),
+    ] = None,
 ) -> None:
     """Set up an :ringed_planet: Odoo Multiverse environment, having different branches checked out at the same time.
 
@@ -122,7 +156,11 @@ def setup(
         single_branch_repos = [repo for repo in SINGLE_BRANCH_REPOS if repo in repositories]
 
         # Clone all source repositories (as bare ones for the multi-branch repos).
-        with ProcessPoolExecutor() as executor, TransientProgress() as progress, Manager() as manager:
+        with (
+            ProcessPoolExecutor(max_workers=MAX_CLONE_WORKERS) as executor,
+            TransientProgress() as progress,
+            Manager() as manager,
+        ):
             # Set up progress trackers for the clone operations.
             progress_updates = cast("dict[OdooRepo, ProgressUpdate]", manager.dict({
                 repo: ProgressUpdate(
@@ -139,11 +177,20 @@ def setup(
             # Run the clone operations in multiple processes simultaneously to speed things up.
             futures = {
                 executor.submit(
-                    _clone_bare_multi_branch_repo if repo in multi_branch_repos else _clone_single_branch_repo,
+                    _clone_bare_multi_branch_repo,
                     repo=repo,
-                    repo_src_dir=(worktree_src_dir if repo in multi_branch_repos else multiverse_dir) / repo.value,
+                    repo_src_dir=worktree_src_dir / repo.value,
+                    partial=partial,
                     progress_updates=progress_updates,
-                ): repo for repo in chain(multi_branch_repos, single_branch_repos)
+                ): repo for repo in multi_branch_repos
+            } | {
+                executor.submit(
+                    _clone_single_branch_repo,
+                    repo=repo,
+                    repo_src_dir=multiverse_dir / repo.value,
+                    depth=depth,
+                    progress_updates=progress_updates,
+                ): repo for repo in single_branch_repos
             }
 
             # Run the progress updater until everything is finished.
@@ -165,40 +212,47 @@ def setup(
         )
 
         # Add the worktrees for each multi-branch repo in each branch.
-        for branch in branches:
-            with ProcessPoolExecutor() as executor, TransientProgress() as progress, Manager() as manager:
-                # Set up progress trackers for the worktree operations.
-                progress_updates = cast("dict[OdooRepo, ProgressUpdate]", manager.dict({
-                    repo: ProgressUpdate(
-                        task_id=progress.add_task(f"Adding [b]{repo.value}[/b] worktree [b]{branch}[/b]", total=None),
-                        description=f"Adding [b]{repo.value}[/b] worktree [b]{branch}[/b]",
-                        completed=0,
-                        total=None,
-                    )
-                    for repo in multi_branch_repos
-                }))
-
-                print_header(f":deciduous_tree: Setup Branch {branch}")
-
-                # Run the worktree operations in multiple processes simultaneously to speed things up.
-                futures = {
-                    executor.submit(
-                        _add_worktree_for_branch,
-                        repo=repo,
-                        branch=branch,
-                        repo_src_dir=worktree_src_dir / repo.value,
-                        repo_worktree_dir=multiverse_dir / branch / repo.value,
-                        progress_updates=progress_updates,
-                    ): repo for repo in multi_branch_repos
-                }
-
-                # Run the progress updater until everything is finished.
-                update_remote_progress(progress=progress, progress_updates=progress_updates, futures=futures)
-
-                # Check for any exceptions.
-                for future in as_completed(futures):
-                    future.result()
-                print()
+        with ThreadPoolExecutor() as executor, TransientProgress() as progress, Manager() as manager:
+            # Set up progress trackers for the worktree operations.
+            progress_updates = cast("dict[tuple[str, OdooRepo], ProgressUpdate]", manager.dict({
+                (branch, repo): ProgressUpdate(
+                    task_id=progress.add_task(f"Adding [b]{repo.value}[/b] worktree [b]{branch}[/b]", total=None),
+                    description=f"Adding [b]{repo.value}[/b] worktree [b]{branch}[/b]",
+                    completed=0,
+                    total=None,
+                )
+                for branch in branches
+                for repo in multi_branch_repos
+            }))
+
+            print_header(":deciduous_tree: Set Up Branch Worktrees")
+
+            # Git can't safely modify the same bare repository concurrently, so those operations are serialized per
+            # repository, while the checkouts of the worktrees run in parallel unless they need to fetch file contents.
+            repo_locks = {repo: Lock() for repo in multi_branch_repos}
+
+            # Run the worktree operations for all branches in multiple threads simultaneously to speed things up.
+            futures = {
+                executor.submit(
+                    _add_worktree_for_branch,
+                    repo=repo,
+                    branch=branch,
+                    repo_src_dir=worktree_src_dir / repo.value,
+                    repo_worktree_dir=multiverse_dir / branch / repo.value,
+                    repo_lock=repo_locks[repo],
+                    progress_updates=progress_updates,
+                ): (branch, repo)
+                for branch in branches
+                for repo in multi_branch_repos
+            }
+
+            # Run the progress updater until everything is finished.
+            update_remote_progress(progress=progress, progress_updates=progress_updates, futures=futures)
+
+            # Check for any exceptions.
+            for future in as_completed(futures):
+                future.result()
+            print()
 
         # Create a VS Code multi-root workspace for each branch, including selected single-branch repositories.
         if vscode:
@@ -255,16 +309,19 @@ def setup(
         raise Exit from e
 
 
-def _clone_bare_multi_branch_repo(  # noqa: C901, PLR0915
+def _clone_bare_multi_branch_repo(  # noqa: PLR0915
     repo: OdooRepo,
     repo_src_dir: Path,
     progress_updates: dict[OdooRepo, ProgressUpdate],
+    partial: bool = True,
 ) -> None:
     """Clone an Odoo repository as a bare repository to create worktrees from later.
 
     :param repo: The repository name.
     :param repo_src_dir: The source directory for the repository.
     :param progress_updates: The progress update information per repository.
+    :param partial: Whether to make a partial clone, only fetching file contents when they are needed, defaults to
+        `True`. The `origin` remote is automatically configured as promisor remote to fetch them from.
     :raises Exit: In case the command needs to be stopped.
     """
     # Ensure the repo source directory exists.
@@ -307,14 +364,13 @@ def _clone_bare_multi_branch_repo(  # noqa: C901, PLR0915
             bare_repo = Repo.clone_from(
                 url=f"git@github.com:odoo/{repo.value}.git",
                 to_path=bare_dir,
-                progress=lambda _op_code, cur_count, max_count, _message: ProgressUpdate.update_in_dict(
+                progress=_get_clone_progress_handler(
                     progress_updates,
                     repo,
                     description=f"Cloning bare repository [b]{repo.value}[/b]",
-                    completed=float(cur_count),
-                    total=float(max_count) if max_count else None,
                 ),
                 bare=True,
+                **({"filter": "blob:none"} if partial else {}),
             )
         except GitCommandError as e:
             ProgressUpdate.update_in_dict(
@@ -342,34 +398,25 @@ def _clone_bare_multi_branch_repo(  # noqa: C901, PLR0915
     else:
         return
 
-    # Explicitly set the remote origin fetch so we can fetch remote branches.
+    # Configure the remotes in a single pass over the repository's config file.
     ProgressUpdate.update_in_dict(
         progress_updates,
         repo,
-        description=f"Setting up origin fetch configuration for [b]{repo.value}[/b]",
+        description=f"Setting up remotes configuration for [b]{repo.value}[/b]",
         completed=0,
         total=1,
     )
-    bare_repo.config_writer().set_value('remote "origin"', "fetch", "+refs/heads/*:refs/remotes/origin/*").release()
+    with bare_repo.config_writer() as config:
+        # Explicitly set the remote origin fetch so we can fetch remote branches.
+        config.set_value('remote "origin"', "fetch", "+refs/heads/*:refs/remotes/origin/*")
+        if repo in ODOO_DEV_REPOS:
+            # Add the "odoo-dev" repository equivalent as a remote named "dev".
+            config.set_value('remote "dev"', "url", f"git@github.com:odoo-dev/{repo.value}.git")
+            config.set_value('remote "dev"', "fetch", "+refs/heads/*:refs/remotes/dev/*")
+            # Make sure people can't push on the "origin" remote when there is a "dev" remote.
+            config.set_value('remote "origin"', "pushurl", "NO_PUSH_TRY_DEV_REPO")
     ProgressUpdate.update_in_dict(progress_updates, repo, advance=1)
 
-    if repo in ODOO_DEV_REPOS:
-        # Add the "odoo-dev" repository equivalent as a remote named "dev".
-        ProgressUpdate.update_in_dict(
-            progress_updates,
-            repo,
-            description=f"Adding [b]odoo-dev[/b] remote as [b]dev[/b] to [b]{repo.value}[/b]",
-            completed=0,
-            total=2,
-        )
-        if not any(remote.name == "dev" for remote in bare_repo.remotes):
-            bare_repo.create_remote("dev", f"git@github.com:odoo-dev/{repo.value}.git")
-        ProgressUpdate.update_in_dict(progress_updates, repo, advance=1)
-
-        # Make sure people can't push on the "origin" remote when there is a "dev" remote.
-        bare_repo.remote("origin").set_url("NO_PUSH_TRY_DEV_REPO", push=True)
-        ProgressUpdate.update_in_dict(progress_updates, repo, advance=1)
-
     # Create the ".git" file pointing to the ".bare" directory.
     ProgressUpdate.update_in_dict(
         progress_updates,
@@ -443,12 +490,14 @@ def _clone_single_branch_repo(
     repo: OdooRepo,
     repo_src_dir: Path,
     progress_updates: dict[OdooRepo, ProgressUpdate],
+    depth: int | None = None,
 ) -> None:
     """Clone an Odoo repository to the given directory.
 
     :param repo: The repository name.
     :param repo_src_dir: The source directory for the repository.
     :param progress_updates: The progress update information per repository.
+    :param depth: The number of commits of history to clone, or `None` to clone the full history, defaults to `None`.
     :raises Exit: In case the command needs to be stopped.
     """
     # Check if the repo source directory already exists.
@@ -482,13 +531,13 @@ def _clone_single_branch_repo(
         Repo.clone_from(
             url=f"git@github.com:odoo/{repo.value}.git",
             to_path=repo_src_dir,
-            progress=lambda _op_code, cur_count, max_count, _message: ProgressUpdate.update_in_dict(
+            progress=_get_clone_progress_handler(
                 progress_updates,
                 repo,
                 description=f"Cloning repository [b]{repo.value}[/b]",
-                completed=float(cur_count),
-                total=float(max_count) if max_count else None,
             ),
+            # Keep all branches available, even when cloning a shallow history.
+            **({"depth": depth, "no_single_branch": True} if depth else {}),
         )
     except GitCommandError as e:
         ProgressUpdate.update_in_dict(
@@ -524,12 +573,62 @@ def _clone_single_branch_repo(
     )
 
 
+def _get_clone_progress_handler(
+    progress_updates: dict[OdooRepo, ProgressUpdate],
+    repo: OdooRepo,
+    description: str,
+) -> Callable[[int, str | float, str | float | None, str], None]:
+    """Get a progress handler for `Repo.clone_from` that forwards the clone progress to the shared progress updates.
+
+    Git reports its progress on every counter change, while each update of the shared dictionary is a round-trip to
+    the manager process. Therefore we only forward the progress when its stage or whole percentage changed.
+
+    :param progress_updates: The progress update information per repository.
+    :param repo: The repository being cloned.
+    :param description: The description to show on the progress bar.
+    :return: A function to pass as `progress` argument.
+    """
+    last_progress: tuple[int, float] | None = None
+
+    def handle_progress(op_code: int, cur_count: str | float, max_count: str | float | None, _message: str) -> None:
+        nonlocal last_progress
+        completed = float(cur_count)
+        current_progress = (
+            op_code & RemoteProgress.OP_MASK,
+            completed * 100 // float(max_count) if max_count else completed,
+        )
+        if current_progress == last_progress:
+            return
+        last_progress = current_progress
+        ProgressUpdate.update_in_dict(
+            progress_updates,
+            repo,
+            description=description,
+            completed=completed,
+            total=float(max_count) if max_count else None,
+        )
+
+    return handle_progress
+
+
+@cache
+def _get_bare_repo(repo_src_dir: Path) -> Repo:
+    """Get the repository in the given source directory, reusing the same instance for all its worktrees.
+
+    :param repo_src_dir: The directory containing the bare repository.
+    :return: The repository.
+    """
+    return Repo(repo_src_dir)
+
+
 def _add_worktree_for_branch(
     repo: OdooRepo,
     branch: str,
     repo_src_dir: Path,
     repo_worktree_dir: Path,
-    progress_updates: dict[OdooRepo, ProgressUpdate],
+    *,
+    repo_lock: Lock,
+    progress_updates: dict[tuple[str, OdooRepo], ProgressUpdate],
 ) -> None:
     """Add and configure a worktree for a specific branch in the given repository.
 
@@ -537,14 +636,16 @@ def _add_worktree_for_branch(
     :param branch: The branch we need to add as a worktree.
     :param repo_src_dir: The directory containing the bare repository.
     :param repo_worktree_dir: The directory to contain the worktree.
-    :param progress_updates: The progress update information per repository.
+    :param repo_lock: The lock guarding the Git operations on the bare repository.
+    :param progress_updates: The progress update information per branch and repository.
     """
+    key = (branch, repo)
     # Check if the worktree repo already exists.
     try:
         Repo(repo_worktree_dir)
         ProgressUpdate.update_in_dict(
             progress_updates,
-            repo,
+            key,
             completed=1,
             total=1,
             status=Status.SUCCESS,
@@ -553,7 +654,7 @@ def _add_worktree_for_branch(
     except InvalidGitRepositoryError:
         ProgressUpdate.update_in_dict(
             progress_updates,
-            repo,
+            key,
             completed=1,
             total=1,
             status=Status.PARTIAL,
@@ -565,36 +666,46 @@ def _add_worktree_for_branch(
     else:
         return
 
-    # Check whether the branch we want to add exists on the remote.
     try:
-        bare_repo = Repo(repo_src_dir)
-        bare_repo.remote("origin").fetch(branch)
-    except (BadName, BadObject, GitCommandError):
-        ProgressUpdate.update_in_dict(
-            progress_updates,
-            repo,
-            completed=1,
-            total=1,
-            status=Status.PARTIAL,
-            message=f"The [b]{repo.value}[/b] branch [b]{branch}[/b] does not exist. Skipping ...",
-        )
-        return
+        # Only one thread at a time can modify the bare repository.
+        with repo_lock:
+            # Check whether the branch we want to add exists on the remote, and fetch its latest changes.
+            bare_repo = _get_bare_repo(repo_src_dir)
+            try:
+                bare_repo.remote("origin").fetch(branch)
+            except GitCommandError:
+                ProgressUpdate.update_in_dict(
+                    progress_updates,
+                    key,
+                    completed=1,
+                    total=1,
+                    status=Status.PARTIAL,
+                    message=f"The [b]{repo.value}[/b] branch [b]{branch}[/b] does not exist. Skipping ...",
+                )
+                return
 
-    try:
-        # Checkout the worktree for the specified branch.
-        ProgressUpdate.update_in_dict(progress_updates, repo, total=2)
-        bare_repo.git.worktree("add", str(repo_worktree_dir), branch)
-        ProgressUpdate.update_in_dict(progress_updates, repo, advance=1)
+            # Add the worktree for the specified branch, without checking out its files yet.
+            ProgressUpdate.update_in_dict(progress_updates, key, total=2)
+            bare_repo.git.worktree("add", "--no-checkout", str(repo_worktree_dir), branch)
 
-        # Make sure the worktree references the right upstream branch.
-        worktree_repo = Repo(repo_worktree_dir)
-        worktree_repo.git.branch("--set-upstream-to", f"origin/{branch}", branch)
-        ProgressUpdate.update_in_dict(progress_updates, repo, advance=1)
+            # Make sure the worktree references the right upstream branch.
+            worktree_repo = Repo(repo_worktree_dir)
+            worktree_repo.git.branch("--set-upstream-to", f"origin/{branch}", branch)
+            ProgressUpdate.update_in_dict(progress_updates, key, advance=1)
+
+            # A partial clone fetches the missing file contents into the bare repository while checking out the files.
+            is_partial = bare_repo.config_reader().get_value('remote "origin"', "promisor", default=False)
+
+        # Check out the files. Without a partial clone, this only touches the worktree itself and can run alongside
+        # other branches.
+        with repo_lock if is_partial else contextlib.nullcontext():
+            worktree_repo.git.reset("--hard")
+        ProgressUpdate.update_in_dict(progress_updates, key, advance=1)
 
     except GitCommandError as e:
         ProgressUpdate.update_in_dict(
             progress_updates,
-            repo,
+            key,
             completed=1,
             total=1,
             status=Status.FAILURE,
@@ -606,7 +717,7 @@ def _add_worktree_for_branch(
     except OSError as e:
         ProgressUpdate.update_in_dict(
             progress_updates,
-            repo,
+            key,
             completed=1,
             total=1,
             status=Status.FAILURE,
@@ -618,7 +729,7 @@ def _add_worktree_for_branch(
 
     ProgressUpdate.update_in_dict(
         progress_updates,
-        repo,
+        key,
         completed=1,
         total=1,
         status=Status.SUCCESS,
@@ -682,11 +793,10 @@ def _setup_multiverse_root_config(
     :param repositories: Selected repositories for this multiverse setup.
     :param reset_config: Whether existing configuration should be overwritten.
     """
-    if not (multiverse_dir / "ruff.toml").exists() or reset_config:
-        shutil.copyfile(MULTIVERSE_CONFIG_DIR / "ruff.toml", multiverse_dir / "ruff.toml")
-
-    if not (multiverse_dir / "requirements.txt").exists() or reset_config:
-        shutil.copyfile(MULTIVERSE_CONFIG_DIR / "requirements.txt", multiverse_dir / "requirements.txt")
+    for file_name in ("ruff.toml", "requirements.txt"):
+        dst_path = multiverse_dir / file_name
+        if reset_config or not dst_path.exists():
+            shutil.copyfile(MULTIVERSE_CONFIG_DIR / file_name, dst_path)
 
     _write_odools_toml(multiverse_dir / "odools.toml", repositories=repositories)
 
@@ -778,7 +888,9 @@ def _setup_tools_and_deps_in_branch_dir(
     ProgressUpdate.update_in_dict(progress_updates, branch, total=3)
 
     # Set up Javascript tooling.
-    if _get_version_number(branch) >= JS_TOOLING_MIN_VERSION:
+    if _get_version_number(branch) >= JS_TOOLING_MIN_VERSION and (
+        reset_config or not _is_js_tooling_enabled(branch_dir)
+    ):
         _disable_js_tooling(branch_dir)
         _enable_js_tooling(branch_dir, progress_updates=progress_updates, branch=branch)
 
@@ -812,15 +924,34 @@ def _setup_tools_and_deps_in_branch_dir(
     )
 
 
-def _pip_install_requirements(uv: str | None, python: Path, requirements: Path) -> None:
-    """Run pip install for the given requirements file if it exists."""
-    if not requirements.is_file():
+def _pip_install_requirements(uv: str | None, python: Path, requirements: Iterable[Path]) -> None:
+    """Install all of the given requirements files that exist, in a single pip run if possible.
+
+    Pins in different files can conflict when they are resolved together. In that case, we install each file on its
+    own, in the given order, so a conflict doesn't prevent the other files from being installed.
+    """
+    requirement_files = [req for req in requirements if req.is_file()]
+    if not requirement_files:
         return
+    try:
+        _run_pip_install(uv, python, requirement_files)
+    except CalledProcessError:
+        if len(requirement_files) == 1:
+            raise
+        for req in requirement_files:
+            _run_pip_install(uv, python, [req])
+
+
+def _run_pip_install(uv: str | None, python: Path, requirement_files: Iterable[Path]) -> None:
+    """Run pip install for the given requirements files."""
+    requirement_args: list[str | Path] = [arg for req in requirement_files for arg in ("-r", req)]
     cmd: list[str | Path]
     if uv:
-        cmd = [uv, "pip", "install", "--python", python, "-q", "-r", requirements]
+        cmd = [uv, "pip", "install", "--python", python, "-q", *requirement_args]
     else:
-        cmd = [python, "-m", "pip", "install", "-q", "-r", requirements]
+        # Skip byte-compiling, Python will do that lazily when the modules get imported.
+        # Prefer wheels, which every branch can install from pip's shared cache instead of building them again.
+        cmd = [python, "-m", "pip", "install", "-q", "--no-compile", "--prefer-binary", *requirement_args]
     subprocess.run(cmd, capture_output=True, check=True)
 
 
@@ -838,7 +969,12 @@ def _configure_python_env_for_branch(
     branch = branch_dir.name
     # Configure Python virtual environment.
     venv_path = branch_dir / ".venv"
-    if venv_path.is_file():
+    # Get the status with a single system call, or `None` if the path doesn't exist.
+    try:
+        venv_stat = venv_path.stat()
+    except OSError:
+        venv_stat = None
+    if venv_stat is not None and not S_ISDIR(venv_stat.st_mode):
         ProgressUpdate.update_in_dict(
             progress_updates,
             branch,
@@ -849,16 +985,24 @@ def _configure_python_env_for_branch(
         )
         return
 
-    if venv_path.is_dir() and reset_config:
+    if venv_stat is not None and reset_config:
         shutil.rmtree(venv_path)
 
     # Find the system Python interpreter to create the virtual environment with.
     python = shutil.which("python3") or "python3"
 
     uv = shutil.which("uv")
+    virtualenv = shutil.which("virtualenv")
     try:
-        # Try creating the virtual environment.
-        cmd: list[str] = [uv, "venv", str(venv_path)] if uv else [python, "-m", "venv", str(venv_path)]
+        # Try creating the virtual environment with an up-to-date pip, preferring the fastest available tool.
+        cmd: list[str]
+        if uv:
+            cmd = [uv, "venv", "--seed", str(venv_path)]
+        elif virtualenv:
+            # virtualenv already bundles a recent pip.
+            cmd = [virtualenv, "--python", python, str(venv_path)]
+        else:
+            cmd = [python, "-m", "venv", "--upgrade-deps", str(venv_path)]
         subprocess.run(cmd, capture_output=True, check=True)
 
         # Locate the Python executable in the virtual environment.
@@ -866,20 +1010,13 @@ def _configure_python_env_for_branch(
         if not python.exists():
             python = venv_path / "Scripts" / "python.exe"  # Windows
 
-        # Try upgrading pip.
-        if uv:
-            cmd = [uv, "pip", "install", "--python", str(python), "-q", "--upgrade", "pip"]
-        else:
-            cmd = [str(python), "-m", "pip", "install", "-q", "--upgrade", "pip"]
-        subprocess.run(cmd, capture_output=True, check=True)
-
-        for req_path in [
+        # Install all requirements at once if they can be resolved together.
+        _pip_install_requirements(uv, python, [
             branch_dir / "odoo" / "requirements.txt",
             branch_dir / "documentation" / "requirements.txt",
             branch_dir / "documentation" / "tests" / "requirements.txt",
             multiverse_dir / "requirements.txt",
-        ]:
-            _pip_install_requirements(uv, python, req_path)
+        ])
 
     except CalledProcessError as e:
         ProgressUpdate.update_in_dict(
@@ -894,6 +1031,7 @@ def _configure_python_env_for_branch(
         )
 
 
+@cache
 def _get_version_number(branch_name: str) -> float:
     """Get the Odoo version number as a float based on the branch name.
 
@@ -902,7 +1040,7 @@ def _get_version_number(branch_name: str) -> float:
     """
     if branch_name == "master":
         return 1000.0
-    match = re.search(r"(\d+.\d)", branch_name)
+    match = VERSION_NUMBER_RE.search(branch_name)
     if match:
         return float(match.group(0))
     return 0.0
@@ -940,6 +1078,11 @@ def _enable_js_tooling(root_dir: Path, progress_updates: dict[str, ProgressUpdat
         )
         return
 
+    # Mark the installed tooling, so we can skip setting it up again later. Enterprise gets the marker via node_modules.
+    tooling_hash = _get_js_tooling_hash(tooling_dir)
+    if tooling_hash:
+        (com_dir / "node_modules" / JS_TOOLING_HASH_FILE).write_text(tooling_hash, encoding="utf-8")
+
     if not ent_dir.is_dir():
         return
 
@@ -948,16 +1091,13 @@ def _enable_js_tooling(root_dir: Path, progress_updates: dict[str, ProgressUpdat
     shutil.copyfile(tooling_dir / "_eslintrc.json", ent_dir / ".eslintrc.json")
     shutil.copyfile(tooling_dir / "_package.json", ent_dir / "package.json")
     if _get_version_number(root_dir.name) >= JS_TOOLING_NEW_VERSION:
-        shutil.copyfile(tooling_dir / "_jsconfig.json", ent_dir / "jsconfig.json")
         try:
-            # Replace "addons" path with relative path from Enterprise in jsconfig.json.
-            with (ent_dir / "jsconfig.json").open("r", encoding="utf-8") as jsconfig_file:
-                jsconfig_content = jsconfig_file.read().replace(
-                    "addons",
-                    f"{os.path.relpath(com_dir, ent_dir)}/addons",
-                )
-            with (ent_dir / "jsconfig.json").open("w", encoding="utf-8") as jsconfig_file:
-                jsconfig_file.write(jsconfig_content)
+            # Write jsconfig.json with the "addons" path replaced by the relative path from Enterprise.
+            jsconfig_content = (tooling_dir / "_jsconfig.json").read_text(encoding="utf-8")
+            (ent_dir / "jsconfig.json").write_text(
+                jsconfig_content.replace("addons", f"{os.path.relpath(com_dir, ent_dir)}/addons"),
+                encoding="utf-8",
+            )
         except OSError as e:
             ProgressUpdate.update_in_dict(
                 progress_updates,
@@ -969,25 +1109,77 @@ def _enable_js_tooling(root_dir: Path, progress_updates: dict[str, ProgressUpdat
             return
     # Copy over node_modules and package-lock.json to avoid "npm install" twice.
     shutil.copyfile(com_dir / "package-lock.json", ent_dir / "package-lock.json")
-    shutil.copytree(com_dir / "node_modules", ent_dir / "node_modules", dirs_exist_ok=True)
+    _link_tree(com_dir / "node_modules", ent_dir / "node_modules")
 
 
-def _disable_js_tooling(root_dir: Path) -> None:
-    """Disable Javascript tooling in the Community and Enterprise repositories.
+def _link_tree(src: Path, dst: Path) -> None:
+    """Recursively copy a directory using hard links, falling back to regular copies where linking is impossible.
 
-    :param root_dir: The parent directory of the "odoo" and "enterprise" repositories.
+    :param src: The directory to copy.
+    :param dst: The destination directory.
+    """
+    def link_or_copy(src_file: str, dst_file: str) -> None:
+        try:
+            os.link(src_file, dst_file)
+        except OSError:
+            # Linking fails across file systems, on unsupported file systems, or when the file already exists.
+            shutil.copy2(src_file, dst_file)
+
+    shutil.copytree(src, dst, copy_function=link_or_copy, dirs_exist_ok=True)
+
+
+def _get_js_tooling_hash(tooling_dir: Path) -> str | None:
+    """Get a hash of the Javascript tooling configuration files.
+
+    :param tooling_dir: The directory containing the tooling configuration files.
+    :return: The hash, or `None` if the files could not be read.
+    """
+    tooling_hash = hashlib.sha256()
+    try:
+        for file_name in JS_TOOLING_SOURCE_FILES:
+            file_path = tooling_dir / file_name
+            if file_path.is_file():
+                tooling_hash.update(file_name.encode())
+                tooling_hash.update(file_path.read_bytes())
+    except OSError:
+        return None
+    return tooling_hash.hexdigest()
+
+
+def _is_js_tooling_enabled(root_dir: Path) -> bool:
+    """Determine if the Javascript tooling is already enabled with the current configuration files.
+
+    :param root_dir: The parent directory of the `odoo` and `enterprise` repositories.
+    :return: `True` if the Community and Enterprise repositories don't need a new tooling setup, `False` otherwise.
     """
     com_dir = root_dir / "odoo"
     ent_dir = root_dir / "enterprise"
+    tooling_hash = _get_js_tooling_hash(com_dir / "addons" / "web" / "tooling")
+    if not tooling_hash:
+        return False
 
     for odoo_dir in (com_dir, ent_dir):
-        if odoo_dir.is_dir():
-            (odoo_dir / ".eslintignore").unlink(missing_ok=True)
-            (odoo_dir / ".eslintrc.json").unlink(missing_ok=True)
-            (odoo_dir / "jsconfig.json").unlink(missing_ok=True)
-            (odoo_dir / "package.json").unlink(missing_ok=True)
-            (odoo_dir / "package-lock.json").unlink(missing_ok=True)
-            shutil.rmtree(odoo_dir / "node_modules", ignore_errors=True)
-            # Support old versions
-            (odoo_dir / ".prettierignore").unlink(missing_ok=True)
-            (odoo_dir / ".prettierrc.json").unlink(missing_ok=True)
+        if not odoo_dir.is_dir():
+            continue
+        try:
+            if (odoo_dir / "node_modules" / JS_TOOLING_HASH_FILE).read_text(encoding="utf-8") != tooling_hash:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _disable_js_tooling(root_dir: Path) -> None:
+    """Disable Javascript tooling in the Community and Enterprise repositories.
+
+    :param root_dir: The parent directory of the "odoo" and "enterprise" repositories.
+    """
+    root = str(root_dir)
+    sep = os.sep
+
+    for odoo_dir in (root + sep + "odoo", root + sep + "enterprise"):
+        for file_name in JS_TOOLING_FILES:
+            # A missing repository directory simply has no files to remove.
+            with contextlib.suppress(FileNotFoundError, NotADirectoryError):
+                os.unlink(odoo_dir + sep + file_name)  # noqa: PTH108
+        shutil.rmtree(odoo_dir + sep + "node_modules", ignore_errors=True)
@@ -1,11 +1,20 @@
 import csv
-from collections.abc import Callable
+import os
+import shutil
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import suppress
+from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
 
+from polib import POFile, pofile
 from rich.console import RenderableType
+from rich.progress import Progress
 from rich.tree import Tree
 
-from odoo_toolkit.common import Status, TransientProgress
+from odoo_toolkit.common import Status, get_valid_modules_to_path_mapping, normalize_list_option
 
 ODOO_LANGUAGES = {
     "am",        # Amharic
@@ -102,8 +111,12 @@ ODOO_LANGUAGES = {
 }
 
 
-def _create_cldr_dicts() -> tuple[dict[str, str], dict[str, str]]:
-    """Create two dictionaries: one mapping language codes to their names, the other to their plural forms rules."""
+@lru_cache(maxsize=1)
+def _get_cldr_dicts() -> tuple[dict[str, str], dict[str, str]]:
+    """Get two dictionaries: one mapping language codes to their names, the other to their plural forms rules.
+
+    The CLDR data is only loaded on first use, to keep it out of the startup time of commands that don't need it.
+    """
     cldr_path = Path(__file__).parent / "cldr.csv"
     names: dict[str, str] = {}
     plural_rules: dict[str, str] = {}
@@ -115,27 +128,27 @@ def _create_cldr_dicts() -> tuple[dict[str, str], dict[str, str]]:
 
             for code, name, nplurals, plural_rule in reader:
                 names[code] = name
-                plural_rules[code] = f"nplurals={nplurals}; plural={plural_rule};"
+                # Many languages share the same rule, so they can share the same string as well.
+                plural_rules[code] = sys.intern(f"nplurals={nplurals}; plural={plural_rule};")
     return names, plural_rules
 
 
-CLDR_LANGUAGE_NAMES, CLDR_PLURAL_RULES = _create_cldr_dicts()
+CLDR_LANG_MAPPING = {
+    "b+es+419": "es_419",
+    "ku": "ckb",
+    "nb": "nb_NO",
+    "pt-rBR": "pt_BR",
+    "sr@latin": "sr_Latn",
+    "zh-rCN": "zh_Hans",
+    "zh-rTW": "zh_Hant",
+    "zh_CN": "zh_Hans",
+    "zh_TW": "zh_Hant",
+}
 
 
 def get_cldr_lang(lang_code: str) -> str:
     """Convert Odoo lang codes to CLDR ones, also used by Weblate."""
-    lang_mapping = {
-        "b+es+419": "es_419",
-        "ku": "ckb",
-        "nb": "nb_NO",
-        "pt-rBR": "pt_BR",
-        "sr@latin": "sr_Latn",
-        "zh-rCN": "zh_Hans",
-        "zh-rTW": "zh_Hant",
-        "zh_CN": "zh_Hans",
-        "zh_TW": "zh_Hant",
-    }
-    return lang_mapping.get(lang_code, lang_code)
+    return CLDR_LANG_MAPPING.get(lang_code, lang_code)
 
 
 def get_language_name(lang: str) -> str:
@@ -145,9 +158,11 @@ def get_language_name(lang: str) -> str:
     :return: The language name for the given language code, or the code itself if not found.
     """
     lang = get_cldr_lang(lang)
-    return CLDR_LANGUAGE_NAMES.get(lang, lang)
+    language_names, _ = _get_cldr_dicts()
+    return language_names.get(lang, lang)
 
 
+@lru_cache
 def get_plural_forms(lang: str) -> str:
     """Get the plural forms rule for a given language code.
 
@@ -155,12 +170,103 @@ def get_plural_forms(lang: str) -> str:
     :return: The plural forms rule for the given language code, or an empty string if not found.
     """
     lang = get_cldr_lang(lang)
-    if lang in CLDR_PLURAL_RULES:
-        return CLDR_PLURAL_RULES[lang]
+    _, plural_rules = _get_cldr_dicts()
+    if lang in plural_rules:
+        return plural_rules[lang]
 
     # Fallback to the base language if the specific locale is not found.
     base_lang = lang.split("_", 1)[0]
-    return CLDR_PLURAL_RULES.get(base_lang, "nplurals=2; plural=(n != 1);")
+    return plural_rules.get(base_lang, "nplurals=2; plural=(n != 1);")
+
+
+def get_po_languages(i18n_path: Path) -> set[str]:
+    """Get the language codes of all .po files in the given directory, listing it only once.
+
+    :param i18n_path: The module's `i18n` directory.
+    :return: The language codes of the existing .po files.
+    """
+    with suppress(OSError), os.scandir(i18n_path) as entries:
+        return {entry.name[:-3] for entry in entries if entry.name.endswith(".po") and entry.is_file()}
+    return set()
+
+
+def get_pot(pot_path: Path) -> POFile:
+    """Get the parsed .pot file for the given path, reusing the previous result as long as the file didn't change.
+
+    :param pot_path: The .pot file path to parse.
+    :return: The parsed .pot file. It should not be modified, since it is shared between callers.
+    """
+    return _get_pot(pot_path, pot_path.stat().st_mtime_ns)
+
+
+def get_pot_keys(pot_path: Path) -> frozenset[str]:
+    """Get the keys (`msgid` with context) of all entries in the given .pot file, for fast membership checks.
+
+    :param pot_path: The .pot file path to get the keys for.
+    :return: The set of keys, reused as long as the file didn't change.
+    """
+    return _get_pot_keys(pot_path, pot_path.stat().st_mtime_ns)
+
+
+# Modules are handled one after the other, so only the current module's .pot file needs to stay in memory.
+@lru_cache(maxsize=1)
+def _get_pot(pot_path: Path, _mtime_ns: int) -> POFile:
+    return pofile(pot_path, encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def _get_pot_keys(pot_path: Path, mtime_ns: int) -> frozenset[str]:
+    return frozenset(entry.msgid_with_context for entry in _get_pot(pot_path, mtime_ns))
+
+
+def get_po_executor(*gettext_commands: str) -> Executor:
+    """Get the executor to run an action on .po files for multiple languages in parallel.
+
+    :param gettext_commands: The gettext commands the action prefers to use.
+    :return: A thread pool if all commands are available, since the work then happens in subprocesses. Otherwise a
+        process pool, since the `polib` fallback is CPU-bound.
+    """
+    if all(shutil.which(cmd) for cmd in gettext_commands):
+        return ThreadPoolExecutor()
+    return ProcessPoolExecutor()
+
+
+def get_modules_to_path_mapping(
+    *,
+    modules: list[str],
+    exclude: list[str],
+    path_filters: Iterable[Path],
+    com_path: Path,
+    ent_path: Path,
+    extra_addons_paths: Iterable[Path],
+) -> dict[str, Path]:
+    """Determine the valid modules and their directories from the common options of the `po` commands.
+
+    :param modules: The requested modules, or `all`, `community`, `enterprise`, `community-l10n`, or `enterprise-l10n`.
+    :param exclude: The module name patterns to exclude.
+    :param path_filters: Only include modules within these paths.
+    :param com_path: The Odoo Community repository.
+    :param ent_path: The Odoo Enterprise repository.
+    :param extra_addons_paths: Extra directories containing Odoo modules.
+    :return: A mapping from all valid modules to their directories.
+    """
+    exclude = normalize_list_option(exclude)
+    resolved_path_filters = [fp.expanduser().resolve() for fp in path_filters]
+
+    def include_path(p: Path) -> bool:
+        if exclude and any(fnmatch(p.name, e) for e in exclude):
+            return False
+        if resolved_path_filters:
+            return any(p.is_relative_to(fp) for fp in resolved_path_filters)
+        return True
+
+    return get_valid_modules_to_path_mapping(
+        modules=normalize_list_option(modules),
+        com_path=com_path,
+        ent_path=ent_path,
+        extra_addons_paths=extra_addons_paths,
+        include_path=include_path,
+    )
 
 
 def update_module_po(
@@ -171,6 +277,8 @@ def update_module_po(
     only_translated: bool = False,
     module_path: Path,
     module_tree: Tree,
+    executor: Executor,
+    progress: Progress,
 ) -> tuple[Status, list[str]]:
     """Perform an action on a module's .po files for the given languages, using the .pot file.
 
@@ -183,6 +291,9 @@ def update_module_po(
         terms.
     :param module_path: The path to the module's directory.
     :param module_tree: The visual tree to render the action's messages, or error messages in.
+    :param executor: The executor to run the `action` for every language in parallel. The `action` needs to be a
+        module-level function when using a process pool.
+    :param progress: The progress display to add the module's language progress to.
     :return: A tuple with the first item being `Status.SUCCESS` if the `action` succeeded for all .po files,
         `Status.FAILURE` if the `action` failed for every .po file, and `Status.PARTIAL` if the `action` succeeded for
         some .po files. The second item is a list of language codes for which the `action` failed.
@@ -193,9 +304,18 @@ def update_module_po(
         module_tree.add("No .pot file found!")
         return Status.FAILURE, []
 
+    futures = {executor.submit(action, lang, pot_path, module_path, only_translated): lang for lang in languages}
+    results: dict[str, tuple[bool, RenderableType]] = {}
+    language_task = progress.add_task(f"Updating [b]{module}[/b]", total=len(futures))
+    for future in as_completed(futures):
+        results[futures[future]] = future.result()
+        progress.advance(language_task)
+    progress.remove_task(language_task)
+
     failures: list[str] = []
-    for lang in TransientProgress().track(languages, description=f"Updating [b]{module}[/b]"):
-        result, renderable = action(lang, pot_path, module_path, only_translated)
+    for lang in languages:
+        # Render the results in the order of the languages, regardless of when they finished.
+        result, renderable = results[lang]
         module_tree.add(renderable)
         success = success or result
         failure = failure or not result
@@ -1,8 +1,9 @@
 import os
 import shutil
 import subprocess
-from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated
 
 from polib import POFile, pofile
@@ -15,7 +16,6 @@ from odoo_toolkit.common import (
     Status,
     TransientProgress,
     get_error_log_panel,
-    get_valid_modules_to_path_mapping,
     normalize_list_option,
     print,
     print_command_title,
@@ -25,7 +25,13 @@ from odoo_toolkit.common import (
     print_warning,
 )
 
-from .common import ODOO_LANGUAGES, get_plural_forms, update_module_po
+from .common import (
+    ODOO_LANGUAGES,
+    get_modules_to_path_mapping,
+    get_plural_forms,
+    get_po_executor,
+    update_module_po,
+)
 
 app = Typer()
 
@@ -94,19 +100,13 @@ def create(
 
     languages = normalize_list_option(languages)
 
-    def include_path(p: Path) -> bool:
-        if exclude and any(fnmatch(p.name, e) for e in exclude):
-            return False
-        if path_filters:
-            return any(p.is_relative_to(fp.expanduser().resolve()) for fp in path_filters)
-        return True
-
-    module_to_path = get_valid_modules_to_path_mapping(
-        modules=normalize_list_option(modules),
+    module_to_path = get_modules_to_path_mapping(
+        modules=modules,
+        exclude=exclude,
+        path_filters=path_filters,
         com_path=com_path,
         ent_path=ent_path,
         extra_addons_paths=extra_addons_paths,
-        include_path=include_path,
     )
 
     if not module_to_path:
@@ -118,23 +118,23 @@ def create(
 
     print_header(":speech_balloon: Create Translation Files")
 
-    # Determine all .po file languages to create.
-    if "all" in languages:
-        languages = list(ODOO_LANGUAGES)
-    languages = sorted(languages)
+    # Determine all .po file languages to create, only once each, since they are created in parallel.
+    languages = sorted(ODOO_LANGUAGES if "all" in languages else set(languages))
 
     status = None
-    with TransientProgress() as progress:
+    with get_po_executor("msginit") as executor, TransientProgress() as progress:
         progress_task = progress.add_task("Creating .po files", total=len(modules))
         for module in modules:
             progress.update(progress_task, description=f"Creating .po files for [b]{module}[/b]")
             module_tree = Tree(f"[b]{module}[/b]")
-            create_status = update_module_po(
+            create_status, _ = update_module_po(
                 action=_create_po_for_lang,
                 module=module,
                 languages=languages,
                 module_path=module_to_path[module],
                 module_tree=module_tree,
+                executor=executor,
+                progress=progress,
             )
             print(module_tree, "")
             status = Status.PARTIAL if status and status != create_status else create_status
@@ -183,17 +183,38 @@ def _create_po_for_lang(lang: str, pot_path: Path, module_path: Path, _: bool) -
     else:
         # Fallback to using `polib` if `msginit` is not available.
         try:
+            header, metadata, entries = _get_serialized_pot(pot_path, pot_path.stat().st_mtime_ns)
             po = POFile()
-            pot = pofile(pot_path)
-            po.header = pot.header
-            po.metadata = pot.metadata.copy()
+            po.header = header
             # Set the correct language and plural forms in the .po file.
-            po.metadata.update({"Language": lang, "Plural-Forms": get_plural_forms(lang)})
-            for entry in pot:
-                # Just add all entries in the .pot to the .po file.
-                po.append(entry)
-            po.save(str(po_path))
+            po.metadata = {**metadata, "Language": lang, "Plural-Forms": get_plural_forms(lang)}
+            # Only the header and metadata differ per language, so we add the already serialized .pot entries to it.
+            with po_path.open("wb") as po_file:
+                po_file.write(str(po).encode())
+                po_file.write(entries)
         except (OSError, ValueError) as e:
             return False, get_error_log_panel(str(e), f"Creating {po_path.name} failed!")
         else:
             return True, f"[d]{po_path.parent}{os.sep}[/d][b]{po_path.name}[/b] :white_check_mark:"
+
+
+# Modules are handled one after the other, so only the current module's .pot file needs to stay in memory.
+@lru_cache(maxsize=1)
+def _get_serialized_pot(pot_path: Path, _mtime_ns: int) -> tuple[str, MappingProxyType[str, str], bytes]:
+    """Parse the given .pot file and serialize its entries, so they can be reused for every language.
+
+    :param pot_path: The .pot file path to parse.
+    :param _mtime_ns: The modification time of the .pot file, to invalidate the cached result when it changes.
+    :return: A tuple containing the header, the read-only metadata and the UTF-8 encoded entries of the .pot file,
+        including their separator from the metadata entry.
+    """
+    # Don't use the shared parsed .pot cache, so the parsed entries can be freed once they're serialized.
+    pot = pofile(pot_path, encoding="utf-8")
+    # Like polib, write the obsolete entries last.
+    entries = [entry for entry in pot if not entry.obsolete]
+    entries.extend(entry for entry in pot if entry.obsolete)
+    return (
+        pot.header,
+        MappingProxyType(pot.metadata),
+        "".join(f"\n{entry.__unicode__(pot.wrapwidth)}" for entry in entries).encode(),
+    )
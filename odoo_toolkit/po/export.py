@@ -3,21 +3,23 @@ import os
 import re
 import shlex
 import subprocess
+import sys
+import threading
 import xmlrpc.client
 from base64 import b64decode
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum
 from fnmatch import fnmatch
-from operator import itemgetter
 from pathlib import Path
-from socket import socket
+from queue import Queue
+from socket import SO_REUSEADDR, SOL_SOCKET, socket
 from subprocess import PIPE, CalledProcessError, Popen
 from typing import Annotated, Any
 
-from polib import pofile
 from rich.progress import Progress, TaskID
 from rich.table import Table
 from typer import Argument, Exit, Option, Typer
@@ -25,6 +27,7 @@ from typer import Argument, Exit, Option, Typer
 from odoo_toolkit.common import (
     EMPTY_LIST,
     TransientProgress,
+    find_modules,
     get_odoo_version,
     get_valid_modules_to_path_mapping,
     is_l10n_module,
@@ -41,6 +44,15 @@ HTTPS_PORT = 443
 WITH_DEMO_VERSION = 18.3
 DEFAULT_EXCLUDE = ["*l10n_*", "*theme_*", "*hw_*", "*test*", "pos_blackbox_be"]
 DEFAULT_RETRY_COMMAND_MAX_WIDTH = 100
+# The number of modules to export at the same time from a single server.
+MAX_EXPORT_WORKERS = 4
+# Matches a `msgid` line that is not empty, or whose value continues on the next line.
+NON_EMPTY_MSGID_RE = re.compile(rb'^msgid (?:"[^"]|""\r?\n"[^"])', re.MULTILINE)
+# Matches the .pot file header lines containing the export date.
+POT_DATES_RE = re.compile(rb'^"(?:POT-Creation-Date|PO-Revision-Date): .*\n', re.MULTILINE)
+# Match the Odoo server log lines reporting the module loading progress.
+LOADING_MODULES_RE = re.compile(r"loading (\d+) modules")
+LOADING_MODULE_RE = re.compile(r"Loading module (\w+) \(\d+/\d+\)")
 
 app = Typer()
 
@@ -217,14 +229,16 @@ def export(  # noqa: C901, PLR0912, PLR0915
     if "default" in exclude:
         exclude = DEFAULT_EXCLUDE
 
+    resolved_path_filters = [fp.expanduser().resolve() for fp in path_filters]
+
     def include_module(module: str) -> bool:
         return not (exclude and any(fnmatch(module, e) for e in exclude))
 
     def include_path(p: Path) -> bool:
         if not include_module(p.name):
             return False
-        if path_filters:
-            return any(p.is_relative_to(fp.expanduser().resolve()) for fp in path_filters)
+        if resolved_path_filters:
+            return any(p.is_relative_to(fp) for fp in resolved_path_filters)
         return True
 
     module_to_path = get_valid_modules_to_path_mapping(
@@ -429,16 +443,20 @@ def _run_server_and_export_terms(
 
     with Popen(odoo_cmd, env=env, stderr=PIPE, text=True) as proc:
         data.progress = progress
-        while proc.poll() is None and proc.stderr:
+        # Read the logs in a separate thread, so the server never blocks on a full pipe while we process them.
+        log_lines: Queue[str | None] = Queue()
+        server_ready = threading.Event()
+        log_reader = threading.Thread(target=_read_server_log, args=(proc, log_lines, server_ready), daemon=True)
+        log_reader.start()
+        while (log_line := log_lines.get()) is not None:
             # As long as the process is still running ...
-            log_line = proc.stderr.readline()
             data.log_buffer += log_line
 
             if _process_server_log_line(log_line=log_line, data=data):
                 # The server is ready to export.
 
-                # Close the pipe to prevent overfilling the buffer and blocking the process.
-                proc.stderr.close()
+                # Stop queueing the logs, since we don't process them anymore.
+                server_ready.set()
 
                 # Stop the progress.
                 progress.update(
@@ -469,6 +487,9 @@ def _run_server_and_export_terms(
                 print_error(data.error_msg or "The server encountered an error.", data.log_buffer.strip())
                 _print_command_for_copy(odoo_cmd)
                 break
+        else:
+            # The logs ended, so the process has exited.
+            proc.wait()
 
         if proc.returncode:
             print_error(
@@ -481,6 +502,10 @@ def _run_server_and_export_terms(
             proc.kill()
             print(f"{server_formatted} Odoo Server has stopped :white_check_mark:")
 
+        # Let the log reader reach the end of the logs before the pipe gets closed.
+        proc.wait()
+        log_reader.join()
+
     if data.database_created and data.server_error:
         print_warning(
             f"The database [b]{database}[/b] was not deleted to allow inspecting the error. "
@@ -501,6 +526,20 @@ def _run_server_and_export_terms(
                 _print_command_for_copy(dropdb_cmd)
 
 
+def _read_server_log(proc: Popen[str], log_lines: Queue[str | None], server_ready: threading.Event) -> None:
+    """Read an Odoo server's log lines into a queue, until the process exits.
+
+    :param proc: The Odoo server process, with its `stderr` piped.
+    :param log_lines: The queue to put the log lines in. `None` is put in the queue when the logs end.
+    :param server_ready: When set, the log lines are discarded instead, only keeping the pipe from filling up.
+    """
+    if proc.stderr:
+        for log_line in proc.stderr:
+            if not server_ready.is_set():
+                log_lines.put(log_line)
+    log_lines.put(None)
+
+
 def _process_server_log_line(log_line: str, data: _LogLineData) -> bool:
     """Process an Odoo server log line and update the passed data.
 
@@ -524,8 +563,7 @@ def _process_server_log_line(log_line: str, data: _LogLineData) -> bool:
         data.database_created = True
         print(f"{data.server_formatted} Database [b]{data.database}[/b] has been created :white_check_mark:")
 
-    match = re.search(r"loading (\d+) modules", log_line)
-    if match:
+    if "loading " in log_line and (match := LOADING_MODULES_RE.search(log_line)):
         data.log_buffer = ""
         if data.progress:
             if data.progress_task is None:
@@ -536,8 +574,7 @@ def _process_server_log_line(log_line: str, data: _LogLineData) -> bool:
             else:
                 data.progress.update(data.progress_task, total=int(match.group(1)))
 
-    match = re.search(r"Loading module (\w+) \(\d+/\d+\)", log_line)
-    if match:
+    if "Loading module " in log_line and (match := LOADING_MODULE_RE.search(log_line)):
         data.log_buffer = ""
         if data.progress is not None and data.progress_task is not None:
             data.progress.update(
@@ -568,134 +605,191 @@ def _export_module_terms(
     :param username: The Odoo username.
     :param password: The Odoo password.
     """
-    common = xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/common")
+    # Share one transport, so all calls reuse the same keep-alive connection to the server.
+    transport = _get_xmlrpc_transport(url)
+    common = xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/common", transport=transport)
     uid = common.authenticate(database, username, password, {})
-    models = xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/object")
-
-    progress_task = progress.add_task(f"{server_formatted} :speech_balloon: Exporting terms", total=None)
+    with xmlrpc.client.ServerProxy(f"{url}/xmlrpc/2/object", transport=transport) as models:
+        progress_task = progress.add_task(f"{server_formatted} :speech_balloon: Exporting terms", total=None)
 
-    modules = list(module_to_path.keys())
-    if not modules:
-        return
+        modules = list(module_to_path.keys())
+        if not modules:
+            return
 
-    # Export the terms.
-    installed_modules = models.execute_kw(
-        database,
-        uid,
-        password,
-        "ir.module.module",
-        "search_read",
-        [
-            [["name", "in", modules], ["state", "=", "installed"]],
-            ["name"],
-        ],
-    )
-    if not isinstance(installed_modules, list):
-        print_warning(f"{server_formatted} No modules installed to export")
-        return
-
-    modules_to_export: list[Mapping[str, str]] = sorted(installed_modules, key=itemgetter("name"))
-    export_table = Table(box=None, pad_edge=False, show_header=False)
-
-    progress.update(progress_task, total=len(modules_to_export))
-    for module in modules_to_export:
-        module_name: str = module["name"]
-        progress.update(
-            progress_task,
-            description=f"{server_formatted} :speech_balloon: Exporting terms for [b]{module_name}[/b]",
-        )
-        # Create the export wizard with the current module.
-        export_id = models.execute_kw(
+        # Export the terms.
+        installed_modules = models.execute_kw(
             database,
             uid,
             password,
-            "base.language.export",
-            "create",
+            "ir.module.module",
+            "search_read",
             [
-                {
-                    "lang": "__new__",
-                    "format": "po",
-                    "modules": [(6, False, [module["id"]])],
-                    "state": "choose",
-                },
+                [["name", "in", modules], ["state", "=", "installed"]],
+                ["name"],
             ],
+            {"order": "name"},
         )
-        # Export the .pot file.
-        models.execute_kw(
-            database,
-            uid,
-            password,
-            "base.language.export",
-            "act_getfile",
-            [[export_id]],
-        )
-        # Get the exported .pot file.
-        pot_file = models.execute_kw(
+        if not isinstance(installed_modules, list):
+            print_warning(f"{server_formatted} No modules installed to export")
+            return
+
+        modules_to_export: list[Mapping[str, str]] = installed_modules
+
+        progress.update(progress_task, total=len(modules_to_export))
+        # Create the export wizards for all modules at once, to avoid a round trip to the server per module.
+        export_ids: list[int] = models.execute_kw(
             database,
             uid,
             password,
             "base.language.export",
-            "read",
-            [[export_id], ["data"], {"bin_size": False}],
+            "create",
+            [
+                [
+                    {
+                        "lang": "__new__",
+                        "format": "po",
+                        "modules": [(6, False, [module["id"]])],
+                        "state": "choose",
+                    }
+                    for module in modules_to_export
+                ],
+            ],
         )
-        if not isinstance(pot_file, list):
-            export_table.add_row(
-                f"[b]{module_name}[/b]",
-                "[d]Exporting the .pot file failed[/d] :negative_squared_cross_mark:",
-            )
-            continue
-        pot_file_content = b64decode(pot_file[0]["data"]) if pot_file[0].get("data") else False
-        i18n_path = module_to_path[module_name] / "i18n"
-        pot_path = i18n_path / f"{module_name}.pot"
-
-        if not pot_file_content or _is_pot_file_empty(pot_file_content):
-            if pot_path.is_file():
-                # Remove empty .pot files.
-                pot_path.unlink()
-                export_table.add_row(
-                    f"[b]{module_name}[/b]",
-                    f"[d]Removed empty[/d] [b]{module_name}.pot[/b] :negative_squared_cross_mark:",
-                )
-                progress.advance(progress_task, 1)
-                continue
 
-            export_table.add_row(
-                f"[b]{module_name}[/b]",
-                "[d]No terms to translate[/d] :negative_squared_cross_mark:",
+        # Proxies aren't thread-safe, so every thread gets its own proxy and connection.
+        thread_data = threading.local()
+        thread_proxies: list[xmlrpc.client.ServerProxy] = []
+
+        def export_module_pot(module_name: str, export_id: int) -> str:
+            if not hasattr(thread_data, "models"):
+                thread_data.models = xmlrpc.client.ServerProxy(
+                    f"{url}/xmlrpc/2/object",
+                    transport=_get_xmlrpc_transport(url),
+                )
+                thread_proxies.append(thread_data.models)
+            return _export_module_pot(
+                module_name=module_name,
+                export_id=export_id,
+                module_path=module_to_path[module_name],
+                models=thread_data.models,
+                database=database,
+                uid=uid,
+                password=password,
             )
-            progress.advance(progress_task, 1)
-            continue
 
+        # Export the .pot files in parallel, so the server keeps exporting while we process the previous files.
+        messages: dict[str, str] = {}
         try:
-            if not i18n_path.exists():
-                i18n_path.mkdir()
-            pot = pofile(pot_file_content.decode())
-            pot.save(str(pot_path))
-        except (OSError, ValueError) as e:
-            export_table.add_row(
-                f"[b]{module_name}[/b]",
-                f"[d]Error while exporting [b]{module_name}.pot[/b][/d] :negative_squared_cross_mark:\n{e}",
-            )
-        else:
-            export_table.add_row(
-                f"[b]{module_name}[/b]",
-                f"[d]{i18n_path}{os.sep}[/d][b]{module_name}.pot[/b] :white_check_mark: ({len(pot)} terms)",
-            )
-        progress.advance(progress_task, 1)
+            with ThreadPoolExecutor(max_workers=MAX_EXPORT_WORKERS) as executor:
+                futures = {
+                    executor.submit(export_module_pot, module["name"], export_id): module["name"]
+                    for module, export_id in zip(modules_to_export, export_ids, strict=True)
+                }
+                for future in as_completed(futures):
+                    module_name = futures[future]
+                    messages[module_name] = future.result()
+                    progress.update(
+                        progress_task,
+                        advance=1,
+                        description=f"{server_formatted} :speech_balloon: Exported terms for [b]{module_name}[/b]",
+                    )
+        finally:
+            for proxy in thread_proxies:
+                proxy("close")()
+
+        export_table = Table(box=None, pad_edge=False, show_header=False)
+        for module in modules_to_export:
+            # Render the results in the order of the modules, regardless of when they finished.
+            export_table.add_row(f"[b]{module['name']}[/b]", messages[module["name"]])
+
+        print()
+        print_header(f":speech_balloon: Exported Terms for {server_name}")
+        print(export_table, "")
+        print(f"{server_formatted} Terms have been exported :white_check_mark:")
+
+
+def _get_xmlrpc_transport(url: str) -> xmlrpc.client.Transport:
+    """Get a transport for XML-RPC proxies, which keeps its connection to the server alive between calls.
 
-    print()
-    print_header(f":speech_balloon: Exported Terms for {server_name}")
-    print(export_table, "")
-    print(f"{server_formatted} Terms have been exported :white_check_mark:")
+    :param url: The Odoo server URL to connect to.
+    :return: A secure transport for HTTPS URLs, or a plain one otherwise.
+    """
+    return xmlrpc.client.SafeTransport() if url.startswith("https") else xmlrpc.client.Transport()
+
+
+def _export_module_pot(
+    *,
+    module_name: str,
+    export_id: int,
+    module_path: Path,
+    models: xmlrpc.client.ServerProxy,
+    database: str,
+    uid: int,
+    password: str,
+) -> str:
+    """Export the .pot file for the given module, using its export wizard.
+
+    :param module_name: The module to export the .pot file for.
+    :param export_id: The ID of the module's `base.language.export` wizard.
+    :param module_path: The path to the module's directory.
+    :param models: The proxy to call the Odoo models with.
+    :param database: The database name.
+    :param uid: The Odoo user ID.
+    :param password: The Odoo password.
+    :return: The message to render for the module.
+    """
+    # Export the .pot file.
+    models.execute_kw(
+        database,
+        uid,
+        password,
+        "base.language.export",
+        "act_getfile",
+        [[export_id]],
+    )
+    # Get the exported .pot file.
+    pot_file = models.execute_kw(
+        database,
+        uid,
+        password,
+        "base.language.export",
+        "read",
+        [[export_id], ["data"], {"bin_size": False}],
+    )
+    if not isinstance(pot_file, list):
+        return "[d]Exporting the .pot file failed[/d] :negative_squared_cross_mark:"
+    pot_file_content = b64decode(pot_file[0]["data"]) if pot_file[0].get("data") else False
+    i18n_path = module_path / "i18n"
+    pot_path = i18n_path / f"{module_name}.pot"
+
+    if not pot_file_content or _is_pot_file_empty(pot_file_content):
+        try:
+            # Remove empty .pot files.
+            pot_path.unlink()
+        except FileNotFoundError:
+            return "[d]No terms to translate[/d] :negative_squared_cross_mark:"
+        return f"[d]Removed empty[/d] [b]{module_name}.pot[/b] :negative_squared_cross_mark:"
+
+    try:
+        # Don't rewrite the .pot file if only its dates would change.
+        current_content = None
+        with suppress(FileNotFoundError):
+            current_content = pot_path.read_bytes()
+        if current_content and POT_DATES_RE.sub(b"", current_content) == POT_DATES_RE.sub(b"", pot_file_content):
+            return f"[d]{i18n_path}{os.sep}[/d][b]{module_name}.pot[/b] (Already up to date)"
+        i18n_path.mkdir(exist_ok=True)
+        # The server already renders the file with `polib`, so we can write it as is.
+        pot_path.write_bytes(pot_file_content)
+    except OSError as e:
+        return f"[d]Error while exporting [b]{module_name}.pot[/b][/d] :negative_squared_cross_mark:\n{e}"
+    terms = len(NON_EMPTY_MSGID_RE.findall(pot_file_content))
+    return f"[d]{i18n_path}{os.sep}[/d][b]{module_name}.pot[/b] :white_check_mark: ({terms} terms)"
 
 
 def _is_pot_file_empty(contents: bytes) -> bool:
     """Determine if the given .pot file's contents doesn't contain translatable terms."""
-    try:
-        pot = pofile(contents.decode())
-        return not any(entry for entry in pot if entry.msgid)
-    except (OSError, ValueError):
-        return False
+    # Scanning the raw bytes avoids decoding and parsing the whole file just to find a single term.
+    return NON_EMPTY_MSGID_RE.search(contents) is None
 
 
 def _get_modules_per_server_type(  # noqa: C901
@@ -738,14 +832,21 @@ def _get_modules_per_server_type(  # noqa: C901
     }
 
     # Determine all modules to export per server type.
+    # Comparing path prefixes as strings is a lot cheaper than `Path.is_relative_to` for every module.
+    com_prefix = os.path.join(com_modules_path, "")  # noqa: PTH118
+    ent_prefix = os.path.join(ent_modules_path, "")  # noqa: PTH118
+    extra_prefixes = tuple(os.path.join(emp, "") for emp in extra_modules_paths)  # noqa: PTH118
     for m, p in module_to_path.items():
-        if p.is_relative_to(com_modules_path):
-            modules_to_export[_ServerType.L10N if is_l10n_module(m) else _ServerType.COM].add(m)
-            modules_to_install[_ServerType.L10N if is_l10n_module(m) else _ServerType.COM].add(m)
-        elif p.is_relative_to(ent_modules_path):
-            modules_to_export[_ServerType.L10N if is_l10n_module(m) else _ServerType.ENT].add(m)
-            modules_to_install[_ServerType.L10N if is_l10n_module(m) else _ServerType.ENT].add(m)
-        elif any(p.is_relative_to(emp) for emp in extra_modules_paths) or m == "base":
+        path = str(p)
+        if path.startswith(com_prefix):
+            server_type = _ServerType.L10N if is_l10n_module(m) else _ServerType.COM
+            modules_to_export[server_type].add(m)
+            modules_to_install[server_type].add(m)
+        elif path.startswith(ent_prefix):
+            server_type = _ServerType.L10N if is_l10n_module(m) else _ServerType.ENT
+            modules_to_export[server_type].add(m)
+            modules_to_install[server_type].add(m)
+        elif path.startswith(extra_prefixes) or m == "base":
             # We want to export base with all addons paths, so we can get all module definitions in there.
             modules_to_export[_ServerType.CUSTOM].add(m)
             modules_to_install[_ServerType.CUSTOM].add(m)
@@ -777,7 +878,7 @@ def _get_modules_per_server_type(  # noqa: C901
                 include_module=paths_and_filter_per_server_type[server_type][1],
             )
             modules_to_install[server_type].update(
-                d for m in modules_to_export[server_type] for d in dependents.get(m, set[str]())
+                d for m in modules_to_export[server_type] for d in dependents.get(m, ())
             )
             # The `calendar` and `rating` modules seem to add fields to a lot of models, so we always install them.
             if include_module("calendar"):
@@ -801,13 +902,12 @@ def _collect_manifest_deps(addons_paths: Iterable[Path]) -> tuple[dict[str, list
     l10n_multilang = False
 
     for addons_path in addons_paths:
-        for manifest_file in addons_path.glob("*/__manifest__.py"):
-            module = manifest_file.parent.name
+        for module, module_path in find_modules(addons_path).items():
             if module == "l10n_multilang":
                 l10n_multilang = True
             all_modules.add(module)
             try:
-                with manifest_file.open() as f:
+                with (module_path / "__manifest__.py").open() as f:
                     manifest = ast.literal_eval(f.read())
             except (OSError, ValueError):
                 continue
@@ -843,7 +943,7 @@ def _expand_excluded_set(
     worklist = list(excluded)
     while worklist:
         m = worklist.pop()
-        for dependent in direct_dependents.get(m, set()):
+        for dependent in direct_dependents.get(m, ()):
             if dependent not in excluded:
                 excluded.add(dependent)
                 worklist.append(dependent)
@@ -914,8 +1014,8 @@ def _get_full_install_modules_per_server_type(
     """Get all modules to install per server type for .pot export with `full_install = True`."""
     modules: dict[_ServerType, set[str]] = defaultdict(set)
 
-    for m in (f.parent.name for f in com_modules_path.glob("*/__manifest__.py")):
-        if not include_path(com_modules_path / m):
+    for m, module_path in find_modules(com_modules_path).items():
+        if not include_path(module_path):
             # Skip module if it doesn't pass the filter.
             continue
         # Add each Community module to the right server types.
@@ -926,8 +1026,8 @@ def _get_full_install_modules_per_server_type(
             modules[_ServerType.ENT].add(m)
             modules[_ServerType.CUSTOM].add(m)
 
-    for m in (f.parent.name for f in ent_modules_path.glob("*/__manifest__.py")):
-        if not include_path(ent_modules_path / m):
+    for m, module_path in find_modules(ent_modules_path).items():
+        if not include_path(module_path):
             # Skip module if it doesn't pass the filter.
             continue
         # Add each Enterprise module to the right server types.
@@ -941,16 +1041,27 @@ def _get_full_install_modules_per_server_type(
 
 
 def _free_port(host: str, start_port: int) -> int:
-    """Find the first free port on the host starting from the provided port."""
+    """Find the first free port on the host starting from the provided port.
+
+    The port is part of the database name, so we prefer predictable ports over any port the OS would assign.
+    """
     for port in range(start_port, 65536):
         with socket() as s:
+            if sys.platform == "linux":
+                # Like the Odoo server, allow ports with connections in TIME_WAIT from a previous run.
+                # Elsewhere, it also allows binding a port that a server is already listening on: always on Windows,
+                # and on macOS and BSD when the server listens on all interfaces, like the Odoo server does.
+                s.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
             try:
                 s.bind((host, port))
             except OSError:
                 continue
             else:
                 return port
-    return 8069
+    # Let the OS assign a free port if none are available from the provided one.
+    with socket() as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
 
 
 def _print_command_for_copy(command: Sequence[str | Path]) -> None:
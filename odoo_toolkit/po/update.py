@@ -1,21 +1,25 @@
+import hashlib
+import json
 import os
 import shutil
 import subprocess
-from fnmatch import fnmatch
+from concurrent.futures import Executor
+from contextlib import suppress
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 from polib import pofile
 from rich.console import RenderableType
+from rich.progress import Progress
 from rich.tree import Tree
 from typer import Argument, Exit, Option, Typer
 
 from odoo_toolkit.common import (
+    APP_DIR,
     EMPTY_LIST,
     Status,
     TransientProgress,
     get_error_log_panel,
-    get_valid_modules_to_path_mapping,
     normalize_list_option,
     print,
     print_command_title,
@@ -25,7 +29,17 @@ from odoo_toolkit.common import (
     print_warning,
 )
 
-from .common import update_module_po
+from .common import (
+    get_modules_to_path_mapping,
+    get_po_executor,
+    get_po_languages,
+    get_pot,
+    get_pot_keys,
+    update_module_po,
+)
+
+# Keeps track of the .pot file and .po file state after each successful update, to skip updates that would be no-ops.
+UPDATE_STATE_FILE = APP_DIR / ".po_update_state.json"
 
 app = Typer()
 
@@ -96,21 +110,13 @@ def update(
     print_command_title(":arrows_counterclockwise: Odoo PO Update")
 
     languages = sorted(normalize_list_option(languages))
-    exclude = normalize_list_option(exclude)
-
-    def include_path(p: Path) -> bool:
-        if exclude and any(fnmatch(p.name, e) for e in exclude):
-            return False
-        if path_filters:
-            return any(p.is_relative_to(fp.expanduser().resolve()) for fp in path_filters)
-        return True
-
-    module_to_path = get_valid_modules_to_path_mapping(
-        modules=normalize_list_option(modules),
+    module_to_path = get_modules_to_path_mapping(
+        modules=modules,
+        exclude=exclude,
+        path_filters=path_filters,
         com_path=com_path,
         ent_path=ent_path,
         extra_addons_paths=extra_addons_paths,
-        include_path=include_path,
     )
 
     if not module_to_path:
@@ -125,28 +131,23 @@ def update(
     status = None
     failed_langs_per_module: dict[str, list[str]] = {}
     all_failed_langs: set[str] = set()
-    with TransientProgress() as progress:
+    update_state = _load_update_state()
+    with get_po_executor("msgmerge", "msgattrib") as executor, TransientProgress() as progress:
         progress_task = progress.add_task("Updating .po files", total=len(modules))
         for module in modules:
             progress.update(progress_task, description=f"Updating .po files for [b]{module}[/b]")
-            if "all" in languages:
-                module_languages = sorted([
-                    lang.stem
-                    for lang in (module_to_path[module] / "i18n").glob("*.po")
-                    if lang.is_file()
-                ])
-            else:
-                module_languages = sorted([
-                    lang for lang in languages if (module_to_path[module] / "i18n" / f"{lang}.po").is_file()
-                ])
+            po_languages = get_po_languages(module_to_path[module] / "i18n")
+            module_languages = sorted(po_languages if "all" in languages else po_languages.intersection(languages))
             module_tree = Tree(f"[b]{module}[/b]")
-            update_status, failed_langs = update_module_po(
-                action=_update_po_for_lang,
+            update_status, failed_langs = _update_outdated_module_po(
                 module=module,
                 languages=module_languages,
                 only_translated=only_translated,
                 module_path=module_to_path[module],
                 module_tree=module_tree,
+                update_state=update_state,
+                executor=executor,
+                progress=progress,
             )
             if failed_langs:
                 failed_langs_per_module[module] = failed_langs
@@ -155,6 +156,8 @@ def update(
             status = Status.PARTIAL if status and status != update_status else update_status
             progress.advance(progress_task, 1)
 
+    _save_update_state(update_state)
+
     failed_langs_per_module_str = "\n".join(
         f"- [b]{module}[/b]: {', '.join(langs)}" for module, langs in failed_langs_per_module.items()
     )
@@ -174,6 +177,113 @@ def update(
             print_error("No translation files were updated!\n")
 
 
+def _update_outdated_module_po(
+    *,
+    module: str,
+    languages: list[str],
+    only_translated: bool,
+    module_path: Path,
+    module_tree: Tree,
+    update_state: dict[str, Any],
+    executor: Executor,
+    progress: Progress,
+) -> tuple[Status, list[str]]:
+    """Update a module's .po files for the given languages, skipping the ones that are already up to date.
+
+    A .po file is up to date if it wasn't modified since it was last updated with the same .pot file contents.
+
+    :param module: The module whose .po files we're updating.
+    :param languages: The language codes of the .po files to update.
+    :param only_translated: Whether to only keep translated terms in the updated `.po` files.
+    :param module_path: The path to the module's directory.
+    :param module_tree: The visual tree to render the messages in.
+    :param update_state: The state of the .po files after their last update, which gets updated in place.
+    :param executor: The executor to run the updates in parallel.
+    :param progress: The progress display to add the module's language progress to.
+    :return: The same result as :func:`odoo_toolkit.po.common.update_module_po`.
+    """
+    i18n_path = module_path / "i18n"
+    pot_path = i18n_path / f"{module}.pot"
+    # Don't read the .pot file if there are no .po files to update.
+    pot_hash = hashlib.blake2b(pot_path.read_bytes()).hexdigest() if languages and pot_path.is_file() else None
+
+    langs_to_update: list[str] = []
+    for lang in languages:
+        po_path = i18n_path / f"{lang}.po"
+        if (
+            pot_hash
+            and (po_state := _get_update_state(pot_hash, po_path, only_translated))
+            and update_state.get(str(po_path)) == po_state
+        ):
+            module_tree.add(f"[d]{po_path.parent}{os.sep}[/d][b]{po_path.name}[/b] (Already up to date)")
+        else:
+            langs_to_update.append(lang)
+    if languages and not langs_to_update:
+        return Status.SUCCESS, []
+
+    update_status, failed_langs = update_module_po(
+        action=_update_po_for_lang,
+        module=module,
+        languages=langs_to_update,
+        only_translated=only_translated,
+        module_path=module_path,
+        module_tree=module_tree,
+        executor=executor,
+        progress=progress,
+    )
+    if update_status == Status.FAILURE and len(langs_to_update) < len(languages):
+        update_status = Status.PARTIAL
+
+    if pot_hash:
+        for lang in set(langs_to_update).difference(failed_langs):
+            po_path = i18n_path / f"{lang}.po"
+            if po_state := _get_update_state(pot_hash, po_path, only_translated):
+                update_state[str(po_path)] = po_state
+            else:
+                update_state.pop(str(po_path), None)
+
+    return update_status, failed_langs
+
+
+def _load_update_state() -> dict[str, Any]:
+    """Load the state of the .po files after their last update.
+
+    :return: A mapping from the .po file paths to their state after the last update, or an empty mapping if unavailable.
+    """
+    with suppress(OSError, ValueError):
+        state = json.loads(UPDATE_STATE_FILE.read_text())
+        if isinstance(state, dict):
+            return state
+    return {}
+
+
+def _save_update_state(state: dict[str, Any]) -> None:
+    """Save the state of the .po files after their last update.
+
+    Entries for .po files that no longer exist are dropped, so the state doesn't keep growing.
+
+    :param state: A mapping from the .po file paths to their state after the last update.
+    """
+    state = {path: po_state for path, po_state in state.items() if Path(path).is_file()}
+    with suppress(OSError):
+        APP_DIR.mkdir(parents=True, exist_ok=True)
+        UPDATE_STATE_FILE.write_text(json.dumps(state))
+
+
+def _get_update_state(pot_hash: str, po_path: Path, only_translated: bool) -> list[Any] | None:
+    """Get the state identifying an update of the given .po file.
+
+    :param pot_hash: The hash of the .pot file's contents.
+    :param po_path: The .po file path.
+    :param only_translated: Whether only translated terms are kept in the .po file.
+    :return: The state as a JSON serializable list, or `None` if the .po file doesn't exist.
+    """
+    try:
+        return [pot_hash, po_path.stat().st_mtime_ns, only_translated]
+    except FileNotFoundError:
+        return None
+
+
 def _update_po_for_lang(lang: str, pot_path: Path, module_path: Path, only_translated: bool) -> tuple[bool, RenderableType]:
     """Update a .po file for the given language and .pot file.
 
@@ -216,16 +326,24 @@ def _update_po_for_lang(lang: str, pot_path: Path, module_path: Path, only_trans
     else:
         # Fallback to using `polib` if `msgmerge` is not available.
         try:
-            po = pofile(po_path)
-            pot = pofile(pot_path)
+            po_content = po_path.read_text(encoding="utf-8")
+            po = pofile(po_content, encoding="utf-8")
+            pot = get_pot(pot_path)
+            # Remove entries that are not in the .pot file anymore, instead of having them marked obsolete by the merge.
+            pot_keys = get_pot_keys(pot_path)
+            po[:] = [entry for entry in po if entry.msgid_with_context in pot_keys]
             # Merge the .po file with the .pot file to update all terms.
             po.merge(pot)
-            # Remove entries that are obsolete.
-            po[:] = [entry for entry in po if not entry.obsolete]
             if only_translated:
                 po[:] = [entry for entry in po if entry.translated()]
-            po.save()
+            updated_po_content = str(po)
+            # Only rewrite the file if the merge changed anything.
+            changed = updated_po_content != po_content
+            if changed:
+                po_path.write_text(updated_po_content, encoding="utf-8")
         except (OSError, ValueError) as e:
             return False, get_error_log_panel(str(e), f"Updating {po_path.name} failed!")
         else:
+            if not changed:
+                return True, f"[d]{po_path.parent}{os.sep}[/d][b]{po_path.name}[/b] (Already up to date)"
             return True, f"[d]{po_path.parent}{os.sep}[/d][b]{po_path.name}[/b] :white_check_mark:"
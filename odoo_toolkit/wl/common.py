@@ -14,6 +14,7 @@ from urllib.parse import urljoin
 from requests import HTTPError, JSONDecodeError, Response, Session
 
 from odoo_toolkit.common import print_warning
+from odoo_toolkit.po.common import get_po_languages
 
 WEBLATE_URL = environ.get("WEBLATE_URL", "https://translate.odoo.com")
 WEBLATE_API_TOKEN = environ.get("WEBLATE_API_TOKEN")
@@ -556,7 +557,7 @@ class WeblateConfig:
                 None,
             )
             if fixed_language_match is None:
-                languages = sorted([lang.stem for lang in (module_path / "i18n").glob("*.po") if lang.is_file()])
+                languages = sorted(get_po_languages(module_path / "i18n"))
             else:
                 _, fixed_languages = fixed_language_match
                 languages = fixed_languages or []
@@ -17,6 +17,7 @@ from odoo_toolkit.common import (
     print_header,
     print_success,
 )
+from odoo_toolkit.po.common import get_po_languages
 
 from .common import WeblateConfig, WeblateConfigError
 
@@ -57,7 +58,7 @@ def _get_config_languages(module_path: Path, module_name: str, languages: list[s
         return languages
 
     i18n_folder = module_path / "i18n"
-    module_languages = [po.stem for po in i18n_folder.glob("*.po")] if i18n_folder.is_dir() else EMPTY_LIST
+    module_languages = sorted(get_po_languages(i18n_folder))
     if not module_languages and (i18n_folder / f"{module_name}.pot").is_file():
         return None
     return module_languages
@@ -133,7 +134,8 @@ def _normalize_odoo_version(value: str) -> str:
     if normalized == "master":
         return normalized
 
-    normalized = re.sub(r"^saas-", "s", normalized)
+    if normalized.startswith("saas-"):
+        normalized = f"s{normalized.removeprefix('saas-')}"
     normalized = normalized.replace(".", "-")
     if re.fullmatch(r"\d{1,2}-0", normalized):
         normalized = normalized[:-2]
@@ -179,11 +181,13 @@ def _update_config(
         languages = EMPTY_LIST
         lang_filter = True
 
+    resolved_path_filters = [fp.expanduser().resolve() for fp in path_filters]
+
     def include_path(p: Path) -> bool:
         if exclude and any(fnmatch(p.name, e) for e in exclude):
             return False
-        if path_filters:
-            return any(p.is_relative_to(fp.expanduser().resolve()) for fp in path_filters)
+        if resolved_path_filters:
+            return any(p.is_relative_to(fp) for fp in resolved_path_filters)
         return True
 
     module_to_path = get_valid_modules_to_path_mapping(
@@ -2,6 +2,7 @@ import itertools
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from fnmatch import fnmatch
+from operator import itemgetter
 from typing import Annotated, Any
 
 from typer import Exit, Option, Typer
@@ -238,8 +239,8 @@ def copy(  # noqa: C901, PLR0912, PLR0915
                         dest_project, comp_dest, lang_dest, upload_data,
                     )
                     for (comp_src, comp_dest), (lang_src, lang_dest) in itertools.product(
-                        sorted(components.items(), key=lambda c: c[0]),
-                        sorted(languages.items(), key=lambda lang: lang[0]),
+                        sorted(components.items(), key=itemgetter(0)),
+                        sorted(languages.items(), key=itemgetter(0)),
                     )
                     if (comp_src, get_cldr_lang(lang_src)) in source_files
                 ]
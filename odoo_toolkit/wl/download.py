@@ -3,6 +3,7 @@ import itertools
 import os
 import zipfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 from typing import Annotated
 
@@ -133,7 +134,7 @@ def download(  # noqa: C901, PLR0912, PLR0915
                     results.extend(language_results)
                     progress.advance(progress_task, len(language_results))
 
-        for component, language_code, status, detail in sorted(results, key=lambda r: (r[0], r[1])):
+        for component, language_code, status, detail in sorted(results, key=itemgetter(0, 1)):
             language_name = get_language_name(language_code)
             if status == "success":
                 successful_downloads += 1
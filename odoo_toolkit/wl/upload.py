@@ -1,5 +1,6 @@
 import itertools
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 from typing import Annotated
 
@@ -160,7 +161,7 @@ def upload(  # noqa: C901, PLR0912, PLR0915
                 results.append((component, *future.result()))
                 progress.advance(progress_task)
 
-        for component, language_code, status, detail in sorted(results, key=lambda r: (r[0], r[1])):
+        for component, language_code, status, detail in sorted(results, key=itemgetter(0, 1)):
             language_name = get_language_name(language_code)
             if status == "missing":
                 missing_po_files.add(Path(detail))
@@ -234,7 +235,7 @@ def _upload_translation(
 
     try:
         if fuzzy == UploadFuzzy.APPROVE:
-            po = pofile(file_path)
+            po = pofile(file_path, encoding="utf-8")
             for entry in po.fuzzy_entries():
                 entry.flags.remove("fuzzy")
             content = str(po).encode("utf-8")